@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
-import base64
+import mmap
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # pragma: no cover - SIMD codec is optional
+    from base64 import b64encode
+
+# Multiple of 3 so each chunk encodes without intermediate padding.
+_CHUNK_SIZE = 3 * 65536
+# Files at least this large are memory-mapped instead of read into a chunk buffer.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+_PNG_MAGIC = {b"\x89PNG\r\n\x1a\n": "image/png"}
+_JPEG_PREFIX = b"\xff\xd8\xff"
+_SUFFIX_MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg"}
 
 
 @dataclass
@@ -17,26 +33,96 @@ class ImagePayload:
 
 
 def _detect_mime_type(path: Path, header: bytes) -> str:
-    if header.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image/png"
-    if header.startswith(b"\xff\xd8\xff"):
+    mime_type = _PNG_MAGIC.get(header[:8])
+    if mime_type:
+        return mime_type
+    if header.startswith(_JPEG_PREFIX):
         return "image/jpeg"
-    suffix = path.suffix.lower()
-    if suffix in {".png", ".jpg", ".jpeg"}:
-        return "image/png" if suffix == ".png" else "image/jpeg"
+    mime_type = _SUFFIX_MIME_TYPES.get(path.suffix.lower())
+    if mime_type:
+        return mime_type
     raise ValueError("Unsupported image format. Use PNG or JPEG.")
 
 
+def _read_file(path: Path) -> bytes:
+    # Read through the raw descriptor to skip BufferedReader setup for a whole-file read.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    if len(chunks) == 1:
+        return chunks[0]
+    return b"".join(chunks)
+
+
 def encode_image(path: str) -> ImagePayload:
     """Load and encode an image for upload."""
     file_path = Path(path)
-    data = file_path.read_bytes()
+    data = _read_file(file_path)
     mime_type = _detect_mime_type(file_path, data[:8])
     return ImagePayload(data=data, filename=file_path.name, mime_type=mime_type)
 
 
+def _read_chunk(handle, view: memoryview) -> int:
+    filled = 0
+    while filled < len(view):
+        count = handle.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+def _build_data_uri(mime_type: str, size: int, chunks: Iterable[memoryview]) -> str:
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    buffer = bytearray(len(prefix) + ((size + 2) // 3) * 4)
+    buffer[: len(prefix)] = prefix
+    offset = len(prefix)
+    for chunk in chunks:
+        encoded = b64encode(chunk)
+        buffer[offset : offset + len(encoded)] = encoded
+        offset += len(encoded)
+    # Guard against the file changing size between fstat and the final read.
+    del buffer[offset:]
+    return buffer.decode("ascii")
+
+
+def _iter_read_chunks(handle, view: memoryview, filled: int) -> Iterator[memoryview]:
+    while filled:
+        yield view[:filled]
+        filled = _read_chunk(handle, view)
+
+
+def _iter_view_chunks(view: memoryview) -> Iterator[memoryview]:
+    for start in range(0, len(view), _CHUNK_SIZE):
+        yield view[start : start + _CHUNK_SIZE]
+
+
 def encode_image_to_data_uri(path: str) -> str:
-    """Return a base64 data URI for a supported image file."""
-    payload = encode_image(path)
-    encoded = base64.b64encode(payload.data).decode("utf-8")
-    return f"data:{payload.mime_type};base64,{encoded}"
+    """Return a base64 data URI for a supported image file.
+
+    The file is encoded chunk by chunk into a single preallocated buffer so the
+    raw image bytes are never held in memory alongside the full encoded copy.
+    Large files are memory-mapped and encoded straight from the page cache.
+    """
+    file_path = Path(path)
+    with open(file_path, "rb", buffering=0) as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    mime_type = _detect_mime_type(file_path, bytes(view[:8]))
+                    return _build_data_uri(mime_type, len(view), _iter_view_chunks(view))
+        view = memoryview(bytearray(_CHUNK_SIZE))
+        filled = _read_chunk(handle, view)
+        mime_type = _detect_mime_type(file_path, bytes(view[:8]))
+        return _build_data_uri(mime_type, size, _iter_read_chunks(handle, view, filled))
@@ -0,0 +1,25 @@
+"""JSON helpers that prefer orjson when it is installed."""
+
+from __future__ import annotations
+
+from json import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(value: object) -> str:
+        """Serialize a value to a JSON string."""
+        return orjson.dumps(value).decode("utf-8")
+
+else:
+    from json import JSONEncoder, loads
+
+    # One compact encoder instance avoids per-call option handling in json.dumps.
+    dumps = JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-import json
+import os
 from pathlib import Path
-from typing import Dict, Generator
+import threading
+from typing import AsyncGenerator, Callable, Dict, Generator, Optional, Tuple
 
 import httpx
 
+from app.core.json_codec import JSONDecodeError, loads as json_loads
+
 BASE_URL = "https://api.meshy.ai"
 OPENAPI_PREFIX = "/openapi/v1"
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
 
 class MeshyApiError(RuntimeError):
@@ -21,6 +26,96 @@ class MeshyApiError(RuntimeError):
         self.status_code = status_code
 
 
+class MeshyStreamError(MeshyApiError):
+    """Represents an error event or malformed message on a Meshy SSE stream."""
+
+
+def _write_all(fd: int, data: bytes) -> int:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+    return len(data)
+
+
+def _preallocate(fd: int, response: httpx.Response) -> int:
+    """Reserve space for an identity-encoded body and return its size, or 0 if unknown."""
+    if "content-encoding" in response.headers:
+        return 0
+    try:
+        size = int(response.headers.get("content-length", 0))
+    except ValueError:
+        return 0
+    if size <= 0:
+        return 0
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Not every filesystem supports preallocation; fall back to growing the file.
+            pass
+    return size
+
+
+class _SSEDecoder:
+    """Incremental SSE parser that matches field names on raw bytes."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._event_type = b""
+        # Reused across events; cleared in place after each dispatch.
+        self._data = bytearray()
+        self._has_data = False
+
+    def feed(self, chunk: bytes) -> Generator[Tuple[bytes, bytes], None, None]:
+        """Yield complete ``(event_type, data)`` pairs contained in ``chunk``."""
+        buffer = self._buffer
+        buffer.extend(chunk)
+        start = 0
+        while True:
+            newline = buffer.find(b"\n", start)
+            if newline < 0:
+                break
+            end = newline - 1 if newline > start and buffer[newline - 1] == 0x0D else newline
+            if end == start:
+                if self._has_data:
+                    payload = bytes(self._data)
+                    self._data.clear()
+                    self._has_data = False
+                    yield self._event_type, payload
+                self._event_type = b""
+            elif buffer.startswith(b"data:", start, end):
+                offset = start + 5
+                if offset < end and buffer[offset] == 0x20:
+                    offset += 1
+                if self._has_data:
+                    self._data.append(0x0A)
+                self._data += buffer[offset:end]
+                self._has_data = True
+            elif buffer.startswith(b"event:", start, end):
+                self._event_type = bytes(buffer[start + 6 : end]).strip()
+            start = newline + 1
+        del buffer[:start]
+
+
+def _decode_sse_event(event_type: bytes, data: bytes) -> Optional[dict]:
+    if event_type == b"message":
+        try:
+            return json_loads(data)
+        except JSONDecodeError as exc:
+            payload = data.decode("utf-8", "replace")
+            raise MeshyStreamError(f"Meshy SSE invalid JSON: {payload}") from exc
+    if event_type == b"error":
+        payload = data.decode("utf-8", "replace")
+        try:
+            error_payload = json_loads(data)
+            message = error_payload.get("message", payload)
+        except JSONDecodeError:
+            message = payload
+        raise MeshyStreamError(f"Meshy SSE error: {message}")
+    return None
+
+
 @dataclass
 class MeshyResponse:
     """Lightweight response placeholder for Meshy API interactions."""
@@ -35,58 +130,120 @@ class MeshyClient:
     def __init__(self, api_key: str, base_url: str = BASE_URL, timeout: float = 15.0) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._api_root = f"{self.base_url}{OPENAPI_PREFIX}"
+        self._image_to_3d_url = self._api_root + "/image-to-3d"
+        self._validate_url = self._image_to_3d_url + "/nonexistent"
         self.timeout = timeout
-
-    def _headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
+        self._json_headers = {
+            "Authorization": f"Bearer {api_key}",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+        self._sse_headers = {**self._json_headers, "Accept": "text/event-stream"}
+        # Pooled clients keep TLS connections alive across requests. Each is
+        # created on first use; the async one inside the event loop that owns it.
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __enter__(self) -> MeshyClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._async_client is not None and self._async_loop is not None:
+            if not self._async_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(self._async_client.aclose(), self._async_loop)
+            self._async_client = None
+
+    async def aclose(self) -> None:
+        """Close pooled connections from within the event loop that owns them."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.aclose()
 
-    def _build_url(self, path: str) -> str:
-        return f"{self.base_url}{OPENAPI_PREFIX}{path}"
+    def _get_client(self) -> httpx.Client:
+        # Worker threads may race on first use.
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    headers=self._json_headers,
+                    timeout=self.timeout,
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=8),
+                )
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self._json_headers,
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+            self._async_loop = asyncio.get_running_loop()
+        return self._async_client
 
     def _raise_for_status(self, response: httpx.Response) -> None:
         if response.status_code < 400:
             return
+        response.read()
         body = response.text.strip().replace("\n", " ")
         snippet = body[:200]
         message = f"Meshy API error {response.status_code}: {snippet}"
         raise MeshyApiError(message, status_code=response.status_code)
 
+    @staticmethod
+    def _is_valid_key_status(status_code: int) -> bool:
+        if status_code in {401, 403}:
+            return False
+        if status_code == 404:
+            return True
+        return 200 <= status_code < 300
+
+    @staticmethod
+    def _task_id_from_response(response: httpx.Response) -> str:
+        data = response.json()
+        task_id = data.get("result") or data.get("id")
+        if not task_id:
+            raise MeshyApiError("Meshy API response missing task id", status_code=response.status_code)
+        return str(task_id)
+
     def validate_key(self) -> bool:
         """Validate the API key with a lightweight Meshy request."""
-        url = self._build_url("/image-to-3d/nonexistent")
+        url = self._validate_url
         try:
-            response = httpx.get(url, headers=self._headers(), timeout=self.timeout)
+            response = self._get_client().get(url)
         except httpx.HTTPError:
             return False
-        if response.status_code in {401, 403}:
-            return False
-        if response.status_code == 404:
-            return True
-        return 200 <= response.status_code < 300
+        return self._is_valid_key_status(response.status_code)
 
     def create_image_to_3d_task(self, payload: dict) -> str:
         """Create an Image-to-3D task and return the task id."""
-        url = self._build_url("/image-to-3d")
+        url = self._image_to_3d_url
         try:
-            response = httpx.post(url, headers=self._headers(), json=payload, timeout=self.timeout)
+            response = self._get_client().post(url, json=payload)
         except httpx.HTTPError as exc:
             raise MeshyApiError(f"Meshy API request failed: {exc}") from exc
         self._raise_for_status(response)
-        data = response.json()
-        task_id = data.get("result") or data.get("id")
-        if not task_id:
-            raise MeshyApiError("Meshy API response missing task id", status_code=response.status_code)
-        return str(task_id)
+        return self._task_id_from_response(response)
 
     def get_image_to_3d_task(self, task_id: str) -> dict:
         """Retrieve an Image-to-3D task by id."""
-        url = self._build_url(f"/image-to-3d/{task_id}")
+        url = self._image_to_3d_url + "/" + task_id
         try:
-            response = httpx.get(url, headers=self._headers(), timeout=self.timeout)
+            response = self._get_client().get(url)
         except httpx.HTTPError as exc:
             raise MeshyApiError(f"Meshy API request failed: {exc}") from exc
         self._raise_for_status(response)
@@ -94,51 +251,84 @@ class MeshyClient:
 
     def stream_image_to_3d_task(self, task_id: str) -> Generator[dict, None, None]:
         """Stream Image-to-3D task updates via SSE."""
-        url = self._build_url(f"/image-to-3d/{task_id}/stream")
-        headers = self._headers()
-        headers["Accept"] = "text/event-stream"
+        url = self._image_to_3d_url + "/" + task_id + "/stream"
         try:
-            with httpx.Client(timeout=None) as client:
-                with client.stream("GET", url, headers=headers) as response:
-                    self._raise_for_status(response)
-                    event_type = None
-                    data_lines: list[str] = []
-                    for line in response.iter_lines():
-                        if not line:
-                            if event_type == "message" and data_lines:
-                                payload = "\n".join(data_lines)
-                                try:
-                                    yield json.loads(payload)
-                                except json.JSONDecodeError as exc:
-                                    raise MeshyApiError(f"Meshy SSE invalid JSON: {payload}") from exc
-                            elif event_type == "error" and data_lines:
-                                payload = "\n".join(data_lines)
-                                try:
-                                    error_payload = json.loads(payload)
-                                    message = error_payload.get("message", payload)
-                                except json.JSONDecodeError:
-                                    message = payload
-                                raise MeshyApiError(f"Meshy SSE error: {message}")
-                            event_type = None
-                            data_lines = []
-                            continue
-                        decoded = line.decode("utf-8")
-                        if decoded.startswith("event:"):
-                            event_type = decoded.split(":", 1)[1].strip()
-                        elif decoded.startswith("data:"):
-                            data_lines.append(decoded.split(":", 1)[1].strip())
+            client = self._get_client()
+            with client.stream("GET", url, headers=self._sse_headers, timeout=None) as response:
+                self._raise_for_status(response)
+                decoder = _SSEDecoder()
+                for chunk in response.iter_bytes():
+                    for event_type, data in decoder.feed(chunk):
+                        payload = _decode_sse_event(event_type, data)
+                        if payload is not None:
+                            yield payload
         except httpx.HTTPError as exc:
             raise MeshyApiError(f"Meshy API request failed: {exc}") from exc
 
-    def download_file(self, url: str, destination: Path) -> Path:
-        """Stream a file download to disk."""
+    async def validate_key_async(self) -> bool:
+        """Validate the API key without blocking the event loop."""
+        try:
+            response = await self._get_async_client().get(self._validate_url)
+        except httpx.HTTPError:
+            return False
+        return self._is_valid_key_status(response.status_code)
+
+    async def get_image_to_3d_task_async(self, task_id: str) -> dict:
+        """Retrieve an Image-to-3D task by id without blocking the event loop."""
+        url = self._image_to_3d_url + "/" + task_id
+        try:
+            response = await self._get_async_client().get(url)
+        except httpx.HTTPError as exc:
+            raise MeshyApiError(f"Meshy API request failed: {exc}") from exc
+        self._raise_for_status(response)
+        return response.json()
+
+    async def stream_image_to_3d_task_async(self, task_id: str) -> AsyncGenerator[dict, None]:
+        """Stream Image-to-3D task updates via SSE without blocking the event loop."""
+        url = self._image_to_3d_url + "/" + task_id + "/stream"
+        client = self._get_async_client()
+        try:
+            async with client.stream("GET", url, headers=self._sse_headers, timeout=None) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                self._raise_for_status(response)
+                decoder = _SSEDecoder()
+                async for chunk in response.aiter_bytes():
+                    for event_type, data in decoder.feed(chunk):
+                        payload = _decode_sse_event(event_type, data)
+                        if payload is not None:
+                            yield payload
+        except httpx.HTTPError as exc:
+            raise MeshyApiError(f"Meshy API request failed: {exc}") from exc
+
+    def download_file(
+        self,
+        url: str,
+        destination: Path,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Path:
+        """Stream a file download to disk.
+
+        ``progress`` is called with ``(bytes_received, total_bytes)`` after each
+        chunk; ``total_bytes`` is 0 when the server does not report a length.
+        """
         destination.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with httpx.stream("GET", url, headers=self._headers(), timeout=self.timeout) as response:
+            with self._get_client().stream("GET", url) as response:
                 self._raise_for_status(response)
-                with destination.open("wb") as handle:
-                    for chunk in response.iter_bytes():
-                        handle.write(chunk)
+                # Write straight to the descriptor; large chunks already amortize syscalls.
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+                fd = os.open(destination, flags, 0o666)
+                try:
+                    total = _preallocate(fd, response)
+                    written = 0
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        written += _write_all(fd, chunk)
+                        if progress is not None:
+                            progress(written, total)
+                    os.ftruncate(fd, written)
+                finally:
+                    os.close(fd)
         except httpx.HTTPError as exc:
             raise MeshyApiError(f"Meshy download failed: {exc}") from exc
         return destination
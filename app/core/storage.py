@@ -2,11 +2,71 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.core import json_codec
+
+_SELECT_COLUMNS = """
+    SELECT task_id, created_at, status, progress, thumbnail_url,
+           model_urls_json, options_json, local_glb_path
+    FROM tasks
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO tasks (
+        task_id,
+        created_at,
+        status,
+        progress,
+        thumbnail_url,
+        model_urls_json,
+        options_json,
+        local_glb_path
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(task_id) DO UPDATE SET
+        created_at=excluded.created_at,
+        status=excluded.status,
+        progress=excluded.progress,
+        thumbnail_url=excluded.thumbnail_url,
+        model_urls_json=excluded.model_urls_json,
+        options_json=excluded.options_json,
+        local_glb_path=excluded.local_glb_path
+"""
+
+_PAGE_ORDER_SQL = " ORDER BY created_at DESC, task_id DESC LIMIT ?"
+
+# Narrow update for the progress loop; it leaves the JSON columns untouched, and
+# an empty status (no status reported yet) keeps the stored one.
+_UPDATE_PROGRESS_SQL = (
+    "UPDATE tasks SET progress = ?, status = COALESCE(NULLIF(?, ''), status) WHERE task_id = ?"
+)
+
+
+def _dump_mapping(value: Dict[str, object]) -> Optional[str]:
+    # Empty mappings are stored as NULL so reads can skip the JSON parser.
+    return json_codec.dumps(value) if value else None
+
+
+def _load_mapping(value: Optional[str]) -> Dict[str, object]:
+    if not value or value == "{}":
+        return {}
+    return json_codec.loads(value)
+
+
+@lru_cache(maxsize=1024)
+def _format_created_at(created_at: str) -> str:
+    try:
+        return datetime.fromisoformat(created_at).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return created_at
 
 
 @dataclass
@@ -21,20 +81,72 @@ class TaskHistoryRecord:
     model_urls: Dict[str, object]
     options: Dict[str, object]
     local_glb_path: Optional[str]
+    # Formatted once per record so list refreshes don't re-parse timestamps.
+    created_at_display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.created_at_display = _format_created_at(self.created_at)
+
+
+_shared: Dict[str, TaskStorage] = {}
+_shared_lock = threading.Lock()
 
 
 class TaskStorage:
     """Stores Meshy task history in SQLite."""
 
+    # Database paths whose schema has already been created in this process.
+    _initialized: Set[str] = set()
+    _initialized_lock = threading.Lock()
+
     def __init__(self, database_path: str) -> None:
         self.database_path = Path(database_path)
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Open begin() calls; the batch transaction commits when this returns to zero.
+        self._batch_depth = 0
+        # Autocommit mode; multi-statement writes open explicit transactions.
+        self._conn = sqlite3.connect(
+            self.database_path, check_same_thread=False, isolation_level=None
+        )
+        # Per-connection settings; journal_mode=WAL persists in the file itself.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8192")
         self.initialize()
 
+    @classmethod
+    def shared(cls, database_path: str) -> TaskStorage:
+        """Return the process-wide storage instance for ``database_path``."""
+        key = str(Path(database_path).resolve())
+        with _shared_lock:
+            storage = _shared.get(key)
+            if storage is None:
+                storage = _shared[key] = cls(database_path)
+            return storage
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """Close every shared instance, committing any batch still open."""
+        with _shared_lock:
+            storages = list(_shared.values())
+            _shared.clear()
+        for storage in storages:
+            storage.close()
+
     def initialize(self) -> None:
         """Initialize the persistence backend."""
-        with sqlite3.connect(self.database_path) as conn:
-            conn.execute(
+        key = str(self.database_path.resolve())
+        with TaskStorage._initialized_lock:
+            if key in TaskStorage._initialized:
+                return
+            self._create_schema()
+            TaskStorage._initialized.add(key)
+
+    def _create_schema(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS settings (
                     key TEXT PRIMARY KEY,
@@ -42,7 +154,7 @@ class TaskStorage:
                 )
                 """
             )
-            conn.execute(
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS tasks (
                     task_id TEXT PRIMARY KEY,
@@ -56,89 +168,155 @@ class TaskStorage:
                 )
                 """
             )
+            # Matches the (created_at, task_id) keyset order so pages need no sort.
+            self._conn.execute("DROP INDEX IF EXISTS idx_tasks_created_at")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_created_at_task_id "
+                "ON tasks(created_at DESC, task_id DESC)"
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection, committing any open batch."""
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth = 0
+                self._conn.execute("COMMIT")
+            self._conn.close()
+
+    def begin(self) -> None:
+        """Start batching writes into one transaction until the matching commit().
+
+        Calls nest; only the outermost begin() opens the transaction.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            if self._batch_depth == 1:
+                self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self) -> None:
+        """End one begin() and commit once no batch remains open."""
+        with self._lock:
+            if not self._batch_depth:
+                return
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._conn.execute("COMMIT")
+
+    def rollback(self) -> None:
+        """Discard every write made since the outermost begin()."""
+        with self._lock:
+            if not self._batch_depth:
+                return
+            self._batch_depth = 0
+            self._conn.execute("ROLLBACK")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # A savepoint acts as a transaction on its own and nests inside begin().
+        with self._lock:
+            self._conn.execute("SAVEPOINT write_many")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK TO write_many")
+                self._conn.execute("RELEASE write_many")
+                raise
+            self._conn.execute("RELEASE write_many")
 
     def upsert(self, record: TaskHistoryRecord) -> None:
         """Insert or update a task history record."""
-        with sqlite3.connect(self.database_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO tasks (
-                    task_id,
-                    created_at,
-                    status,
-                    progress,
-                    thumbnail_url,
-                    model_urls_json,
-                    options_json,
-                    local_glb_path
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(task_id) DO UPDATE SET
-                    created_at=excluded.created_at,
-                    status=excluded.status,
-                    progress=excluded.progress,
-                    thumbnail_url=excluded.thumbnail_url,
-                    model_urls_json=excluded.model_urls_json,
-                    options_json=excluded.options_json,
-                    local_glb_path=excluded.local_glb_path
-                """,
-                (
-                    record.task_id,
-                    record.created_at,
-                    record.status,
-                    record.progress,
-                    record.thumbnail_url,
-                    json.dumps(record.model_urls),
-                    json.dumps(record.options),
-                    record.local_glb_path,
-                ),
-            )
+        with self._lock:
+            self._conn.execute(_UPSERT_SQL, self._record_to_row(record))
 
-    def list_all(self) -> List[TaskHistoryRecord]:
-        """Return all stored task history records."""
-        with sqlite3.connect(self.database_path) as conn:
-            rows = conn.execute(
-                """
-                SELECT task_id, created_at, status, progress, thumbnail_url,
-                       model_urls_json, options_json, local_glb_path
-                FROM tasks
-                ORDER BY created_at DESC
-                """
+    def upsert_many(self, records: Iterable[TaskHistoryRecord]) -> None:
+        """Insert or update several task history records in one transaction."""
+        rows = [self._record_to_row(record) for record in records]
+        if not rows:
+            return
+        with self._transaction() as conn:
+            conn.executemany(_UPSERT_SQL, rows)
+
+    def update_progress(self, task_id: str, progress: Optional[float], status: str) -> None:
+        """Update only the progress and status columns of a stored task."""
+        with self._lock:
+            self._conn.execute(_UPDATE_PROGRESS_SQL, (progress, status, task_id))
+
+    def list_all(self, limit: Optional[int] = None) -> List[TaskHistoryRecord]:
+        """Return stored task history records, most recent first."""
+        return self.list_range(-1 if limit is None else limit)
+
+    def list_range(
+        self, limit: int, before: Optional[Tuple[str, str]] = None
+    ) -> List[TaskHistoryRecord]:
+        """Return one page of task history records, most recent first.
+
+        ``before`` is the ``(created_at, task_id)`` key of the last record on the
+        previous page. Keyset paging keeps pages stable when newer tasks are
+        inserted between loads, which an OFFSET would shift.
+        """
+        with self._lock:
+            if before is None:
+                rows = self._conn.execute(
+                    _SELECT_COLUMNS + _PAGE_ORDER_SQL, (limit,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    _SELECT_COLUMNS + "WHERE (created_at, task_id) < (?, ?)" + _PAGE_ORDER_SQL,
+                    (*before, limit),
+                ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def list_newer(self, after: Tuple[str, str]) -> List[TaskHistoryRecord]:
+        """Return records newer than the ``(created_at, task_id)`` key, most recent first."""
+        with self._lock:
+            rows = self._conn.execute(
+                _SELECT_COLUMNS
+                + "WHERE (created_at, task_id) > (?, ?) ORDER BY created_at DESC, task_id DESC",
+                after,
             ).fetchall()
         return [self._row_to_record(row) for row in rows]
 
     def fetch_by_id(self, task_id: str) -> Optional[TaskHistoryRecord]:
         """Fetch a task record by id."""
-        with sqlite3.connect(self.database_path) as conn:
-            row = conn.execute(
-                """
-                SELECT task_id, created_at, status, progress, thumbnail_url,
-                       model_urls_json, options_json, local_glb_path
-                FROM tasks
-                WHERE task_id = ?
-                """,
+        with self._lock:
+            row = self._conn.execute(
+                _SELECT_COLUMNS + "WHERE task_id = ?",
                 (task_id,),
             ).fetchone()
         if not row:
             return None
         return self._row_to_record(row)
 
-    def _row_to_record(self, row: tuple) -> TaskHistoryRecord:
+    @staticmethod
+    def _record_to_row(record: TaskHistoryRecord) -> tuple:
+        return (
+            record.task_id,
+            record.created_at,
+            record.status,
+            record.progress,
+            record.thumbnail_url,
+            _dump_mapping(record.model_urls),
+            _dump_mapping(record.options),
+            record.local_glb_path,
+        )
+
+    @staticmethod
+    def _row_to_record(row: tuple) -> TaskHistoryRecord:
         return TaskHistoryRecord(
             task_id=row[0],
             created_at=row[1],
             status=row[2],
             progress=row[3],
             thumbnail_url=row[4],
-            model_urls=json.loads(row[5]) if row[5] else {},
-            options=json.loads(row[6]) if row[6] else {},
+            model_urls=_load_mapping(row[5]),
+            options=_load_mapping(row[6]),
             local_glb_path=row[7],
         )
 
 
 def init_db(database_path: str) -> None:
     """Initialize the task history database at the given path."""
-    TaskStorage(database_path)
+    TaskStorage.shared(database_path)
 
 
 def upsert_task(
@@ -153,36 +331,24 @@ def upsert_task(
     local_glb_path: Optional[str],
 ) -> None:
     """Insert or update a task record in the database."""
-    storage = TaskStorage(database_path)
     record = TaskHistoryRecord(
         task_id=task_id,
         created_at=created_at,
         status=status,
         progress=progress,
         thumbnail_url=thumbnail_url,
-        model_urls=json.loads(model_urls_json) if model_urls_json else {},
-        options=json.loads(options_json) if options_json else {},
+        model_urls=_load_mapping(model_urls_json),
+        options=_load_mapping(options_json),
         local_glb_path=local_glb_path,
     )
-    storage.upsert(record)
+    TaskStorage.shared(database_path).upsert(record)
 
 
 def list_tasks(database_path: str, limit: int = 200) -> List[TaskHistoryRecord]:
     """Return stored tasks ordered by most recent."""
-    with sqlite3.connect(database_path) as conn:
-        rows = conn.execute(
-            """
-            SELECT task_id, created_at, status, progress, thumbnail_url,
-                   model_urls_json, options_json, local_glb_path
-            FROM tasks
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
-    return [TaskStorage(database_path)._row_to_record(row) for row in rows]
+    return TaskStorage.shared(database_path).list_all(limit=limit)
 
 
 def get_task(database_path: str, task_id: str) -> Optional[TaskHistoryRecord]:
     """Fetch a task record by id."""
-    return TaskStorage(database_path).fetch_by_id(task_id)
+    return TaskStorage.shared(database_path).fetch_by_id(task_id)
@@ -1,14 +1,76 @@
-"""Threaded task runner for monitoring Meshy generation progress."""
+"""Asyncio-driven task runner for monitoring Meshy generation progress."""
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Coroutine, Dict, Optional
 
-from PySide6.QtCore import QThread, Signal
+import httpx
+from PySide6.QtCore import QObject, Signal
 
-from app.core.meshy_client import MeshyClient
+from app.core.meshy_client import MeshyApiError, MeshyClient, MeshyStreamError
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed", "canceled"})
+# Status codes meaning the SSE endpoint is unavailable rather than the task being bad.
+_STREAM_UNSUPPORTED_CODES = frozenset({404, 405, 501})
+# Progress bars gain nothing from more than ~10 updates per second.
+PROGRESS_EMIT_INTERVAL_S = 0.1
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop shared by all task runners."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever, name="meshy-task-loop", daemon=True
+            )
+            thread.start()
+        return _loop
+
+
+class AsyncCall(QObject):
+    """Runs one coroutine on the shared event loop and reports its outcome.
+
+    Like TaskRunner, signals are emitted from the loop thread and queued to
+    receivers on the GUI thread, so slots can touch widgets directly.
+    """
+
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, coro: Coroutine[Any, Any, object], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._coro = coro
+        self._future: Optional[Future] = None
+
+    def start(self) -> None:
+        """Schedule the coroutine on the shared event loop."""
+        self._future = asyncio.run_coroutine_threadsafe(self._run(), _shared_loop())
+
+    def cancel(self) -> None:
+        """Cancel the coroutine if it has not finished yet."""
+        if self._future is not None:
+            self._future.cancel()
+
+    async def _run(self) -> None:
+        try:
+            result = await self._coro
+        except Exception as exc:
+            self.failed.emit(str(exc) or type(exc).__name__)
+            return
+        self.succeeded.emit(result)
 
 
 @dataclass
@@ -21,13 +83,19 @@ class TaskUpdate:
     payload: Dict[str, object]
 
 
-class TaskRunner(QThread):
-    """Runs Meshy task monitoring in a background thread."""
+class TaskRunner(QObject):
+    """Monitors a Meshy task on the shared background event loop.
 
-    progressChanged = Signal(int)
-    statusChanged = Signal(str)
+    Signals are emitted from the loop thread; Qt queues them to receivers
+    living on the GUI thread.
+    """
+
+    # (status, progress); progress is -1 until the API reports one.
+    changed = Signal(str, int)
     taskCompleted = Signal(dict)
     taskFailed = Signal(str)
+    # Emitted however run() ends, including streams closing early and cancellation.
+    monitoringEnded = Signal()
 
     def __init__(self, client: MeshyClient, task_id: str, interval_s: float = 3.0) -> None:
         super().__init__()
@@ -35,55 +103,103 @@ class TaskRunner(QThread):
         self.task_id = task_id
         self.interval_s = interval_s
         self._running = True
+        self._terminal = False
+        self._last_progress = -1
+        self._last_emit_ts = 0.0
+        self._last_status = ""
+        self._future: Optional[Future] = None
+
+    def start(self) -> None:
+        """Schedule the monitoring coroutine on the shared event loop."""
+        self._running = True
+        self._future = asyncio.run_coroutine_threadsafe(self.run(), _shared_loop())
+
+    def isRunning(self) -> bool:
+        """Return whether the monitoring coroutine is still active."""
+        return self._future is not None and not self._future.done()
 
-    def run(self) -> None:
+    async def run(self) -> None:
         """Execute the monitoring loop."""
         try:
-            self._run_streaming()
-        except Exception as exc:
-            if not self._running:
+            await self._monitor()
+        finally:
+            self.monitoringEnded.emit()
+
+    async def _monitor(self) -> None:
+        try:
+            await self._run_streaming()
+        except (MeshyApiError, httpx.HTTPError) as exc:
+            if not self._running or self._terminal:
+                return
+            if not self._should_fall_back(exc):
+                self.taskFailed.emit(str(exc))
                 return
             try:
-                self._run_polling()
-            except Exception as poll_exc:
+                await self._run_polling()
+            except (MeshyApiError, httpx.HTTPError) as poll_exc:
                 self.taskFailed.emit(str(poll_exc) or str(exc))
+        except Exception as exc:
+            # Unexpected errors are surfaced rather than retried by polling. Nothing
+            # reads the future's result, so log here instead of re-raising into it.
+            logger.exception("Monitoring task %s failed", self.task_id)
+            if not self._terminal:
+                self.taskFailed.emit(str(exc) or type(exc).__name__)
+
+    @staticmethod
+    def _should_fall_back(exc: Exception) -> bool:
+        # The stream worked but reported a problem; polling would only repeat it.
+        if isinstance(exc, MeshyStreamError):
+            return False
+        status_code = getattr(exc, "status_code", None)
+        return status_code is None or status_code in _STREAM_UNSUPPORTED_CODES
 
     def stop(self) -> None:
         """Stop the monitoring loop."""
         self._running = False
+        if self._future is not None:
+            self._future.cancel()
 
-    def _run_streaming(self) -> None:
-        for payload in self.client.stream_image_to_3d_task(self.task_id):
+    async def _run_streaming(self) -> None:
+        async for payload in self.client.stream_image_to_3d_task_async(self.task_id):
             if not self._running:
                 return
             self._handle_payload(payload)
             status = str(payload.get("status", ""))
-            if status in {"succeeded", "failed", "canceled"}:
+            if status in TERMINAL_STATUSES:
                 return
 
-    def _run_polling(self) -> None:
+    async def _run_polling(self) -> None:
         while self._running:
-            payload = self.client.get_image_to_3d_task(self.task_id)
+            payload = await self.client.get_image_to_3d_task_async(self.task_id)
             self._handle_payload(payload)
             status = str(payload.get("status", ""))
-            if status in {"succeeded", "failed", "canceled"}:
+            if status in TERMINAL_STATUSES:
                 return
-            time.sleep(self.interval_s)
+            await asyncio.sleep(self.interval_s)
 
     def _handle_payload(self, payload: Dict[str, object]) -> None:
-        status = str(payload.get("status", ""))
-        if status:
-            self.statusChanged.emit(status)
+        status = str(payload.get("status", "")) or self._last_status
+        terminal = status in TERMINAL_STATUSES
+        if terminal:
+            self._terminal = True
+        progress = self._last_progress
         progress_value = payload.get("progress")
         if progress_value is not None:
             try:
                 progress_float = float(progress_value)
-                if 0 <= progress_float <= 1:
-                    progress_float *= 100
-                progress = int(progress_float)
-                self.progressChanged.emit(progress)
-            except (TypeError, ValueError):
+                progress = int(progress_float * 100 if 0 <= progress_float <= 1 else progress_float)
+            except (TypeError, ValueError, OverflowError):
                 pass
+        now = time.monotonic()
+        # One queued cross-thread emit per meaningful change; progress alone is throttled.
+        if status != self._last_status or (
+            progress != self._last_progress
+            and (terminal or now - self._last_emit_ts >= PROGRESS_EMIT_INTERVAL_S)
+        ):
+            self._last_status = status
+            self._last_progress = progress
+            self._last_emit_ts = now
+            self.changed.emit(status, progress)
         if status == "succeeded":
             self.taskCompleted.emit(payload)
         elif status in {"failed", "canceled"}:
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.core.secrets import load_key
+from app.core.storage import TaskStorage
 from app.ui.generator_view import GeneratorView
 from app.ui.history_view import HistoryView
 from app.ui.login_view import LoginView
@@ -97,6 +98,8 @@ def main() -> None:
     app = QApplication(sys.argv)
     app.setApplicationName("Meshy Desktop Lab")
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    # Commits a task's batched progress writes if the app quits mid-task.
+    app.aboutToQuit.connect(TaskStorage.close_shared)
     window = MainWindow()
     window.resize(1200, 800)
     window.show()
@@ -105,6 +105,14 @@ window.loadModel = function loadModel(url) {
   );
 };
 
+if (window.qt && window.qt.webChannelTransport && window.QWebChannel) {
+  new QWebChannel(window.qt.webChannelTransport, (channel) => {
+    const bridge = channel.objects.bridge;
+    bridge.loadModelRequested.connect(window.loadModel);
+    bridge.viewerReady();
+  });
+}
+
 function animate() {
   requestAnimationFrame(animate);
   controls.update();
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
-
-from PySide6.QtCore import Qt, QStandardPaths, Signal
-from PySide6.QtGui import QPixmap
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSize,
+    QStandardPaths,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+)
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -25,11 +36,89 @@ from PySide6.QtWidgets import (
 )
 
 from app.core.image_codec import encode_image_to_data_uri
-from app.core.meshy_client import MeshyApiError, MeshyClient
+from app.core.meshy_client import MeshyClient
 from app.core.storage import TaskHistoryRecord, TaskStorage
 from app.core.task_runner import TaskRunner
 
 
+class _CreateTaskSignals(QObject):
+    taskCreated = Signal(str)
+    taskFailed = Signal(str)
+
+
+class CreateTaskWorker(QRunnable):
+    """Encodes the source image and submits an Image-to-3D task off the GUI thread."""
+
+    def __init__(
+        self,
+        client: MeshyClient,
+        image_path: Path,
+        options: Dict[str, object],
+        image_uri: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.client = client
+        self.image_path = image_path
+        self.options = options
+        self.image_uri = image_uri
+        self.signals = _CreateTaskSignals()
+
+    def run(self) -> None:
+        try:
+            if self.image_uri is None:
+                self.image_uri = encode_image_to_data_uri(str(self.image_path))
+            payload = {"image_url": self.image_uri, **self.options}
+            task_id = self.client.create_image_to_3d_task(payload)
+        except Exception as exc:
+            # Anything escaping run() would leave the view waiting on a signal forever.
+            self.signals.taskFailed.emit(str(exc) or type(exc).__name__)
+            return
+        self.signals.taskCreated.emit(task_id)
+
+
+class _PreviewSignals(QObject):
+    previewReady = Signal(str, QImage)
+
+
+class DecodePreviewRunnable(QRunnable):
+    """Loads and scales the selected image into a QImage on a pool thread."""
+
+    def __init__(self, path: str, target_size: QSize, signals: _PreviewSignals) -> None:
+        super().__init__()
+        self.path = path
+        self.target_size = target_size
+        self.signals = signals
+
+    def run(self) -> None:
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(self.target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.previewReady.emit(self.path, image)
+
+
+class DownloadWorker(QThread):
+    """Downloads a generated model to disk on a background thread."""
+
+    progress = Signal("qint64", "qint64")
+    completed = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, client: MeshyClient, url: str, destination: Path) -> None:
+        super().__init__()
+        self.client = client
+        self.url = url
+        self.destination = destination
+
+    def run(self) -> None:
+        try:
+            path = self.client.download_file(self.url, self.destination, self.progress.emit)
+        except Exception as exc:
+            # As in CreateTaskWorker, every failure must reach the view as a signal.
+            self.failed.emit(str(exc) or type(exc).__name__)
+            return
+        self.completed.emit(path)
+
+
 class GeneratorView(QWidget):
     """Widget responsible for selecting images and task options."""
 
@@ -43,13 +132,31 @@ class GeneratorView(QWidget):
         self._selected_image: Optional[Path] = None
         self._client: Optional[MeshyClient] = None
         self._task_runner: Optional[TaskRunner] = None
+        # Runners still monitoring, by task id; each holds the client it was started with.
+        self._active_runners: Dict[str, TaskRunner] = {}
+        # Clients replaced by set_api_key, closed once no worker or runner uses them.
+        self._retired_clients: List[MeshyClient] = []
+        self._create_worker: Optional[CreateTaskWorker] = None
+        # Held until the thread's finished signal; dropping a running QThread aborts.
+        self._download_worker: Optional[DownloadWorker] = None
+        self._queued_model_urls: Optional[Dict[str, object]] = None
+        self._download_model_urls: Dict[str, object] = {}
+        self._pending_options: Dict[str, object] = {}
+        # (path, mtime, size, data URI) of the last encoded image, reused on retries.
+        self._encoded_cache: Optional[Tuple[Path, float, int, str]] = None
+        self._pending_image_key: Tuple[Optional[Path], float, int] = (None, 0.0, 0)
         self._last_download: Optional[Path] = None
         self._current_task_id: Optional[str] = None
         self._current_created_at: Optional[str] = None
         self._last_options: Dict[str, object] = {}
         self._last_progress: Optional[float] = None
+        self._last_status = ""
+        self._last_persisted_progress = -1.0
+        self._last_persist_ts = 0.0
+        # Whether the running task's progress writes are batched in an open transaction.
+        self._storage_batch_open = False
 
-        self._storage = TaskStorage(self._db_path())
+        self._storage = TaskStorage.shared(self._db_path())
 
         self._image_button = QPushButton("Select Image")
         self._image_button.clicked.connect(self._select_image)
@@ -58,6 +165,8 @@ class GeneratorView(QWidget):
         self._preview_label.setAlignment(Qt.AlignCenter)
         self._preview_label.setFixedSize(240, 240)
         self._preview_label.setStyleSheet("border: 1px solid #999;")
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.previewReady.connect(self._handle_preview_ready)
 
         self._prompt_input = QLineEdit()
         self._negative_prompt_input = QLineEdit()
@@ -135,7 +244,23 @@ class GeneratorView(QWidget):
     def set_api_key(self, api_key: str) -> None:
         """Provide the API key to use for Meshy requests."""
         self._api_key = api_key
+        if self._client:
+            self._retired_clients.append(self._client)
         self._client = MeshyClient(api_key)
+        self._close_idle_clients()
+
+    def _close_idle_clients(self) -> None:
+        in_use = {id(runner.client) for runner in self._active_runners.values()}
+        for worker in (self._create_worker, self._download_worker):
+            if worker is not None:
+                in_use.add(id(worker.client))
+        busy = []
+        for client in self._retired_clients:
+            if id(client) in in_use:
+                busy.append(client)
+            else:
+                client.close()
+        self._retired_clients = busy
 
     def _db_path(self) -> str:
         base = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
@@ -208,15 +333,20 @@ class GeneratorView(QWidget):
         if not file_path:
             return
         self._selected_image = Path(file_path)
-        pixmap = QPixmap(file_path)
-        if not pixmap.isNull():
-            self._preview_label.setPixmap(
-                pixmap.scaled(
-                    self._preview_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-            )
+        self._encoded_cache = None
+        self._preview_label.setPixmap(QPixmap())
+        self._preview_label.setText("Loading preview...")
+        QThreadPool.globalInstance().start(
+            DecodePreviewRunnable(file_path, self._preview_label.size(), self._preview_signals)
+        )
+
+    def _handle_preview_ready(self, path: str, image: QImage) -> None:
+        if self._selected_image != Path(path):
+            return
+        if image.isNull():
+            self._preview_label.setText("Preview unavailable")
+            return
+        self._preview_label.setPixmap(QPixmap.fromImage(image))
 
     def _handle_generate(self) -> None:
         if not self._api_key or not self._client:
@@ -225,23 +355,52 @@ class GeneratorView(QWidget):
         if not self._selected_image:
             self._status_label.setText("Please select an image.")
             return
+
         try:
-            image_uri = encode_image_to_data_uri(str(self._selected_image))
-        except ValueError as exc:
+            stat = self._selected_image.stat()
+        except OSError as exc:
             self._status_label.setText(str(exc))
             return
+        image_uri = None
+        cache = self._encoded_cache
+        if cache and cache[:3] == (self._selected_image, stat.st_mtime, stat.st_size):
+            image_uri = cache[3]
 
         options = self._collect_options()
-        payload = {"image_url": image_uri, **options}
-
-        try:
-            task_id = self._client.create_image_to_3d_task(payload)
-        except MeshyApiError as exc:
-            self._status_label.setText(str(exc))
-            return
+        self._pending_options = options
+        self._generate_button.setEnabled(False)
+        self._status_label.setText("Submitting task...")
+
+        worker = CreateTaskWorker(self._client, self._selected_image, options, image_uri)
+        self._pending_image_key = (self._selected_image, stat.st_mtime, stat.st_size)
+        worker.signals.taskCreated.connect(self._on_task_created)
+        worker.signals.taskFailed.connect(self._on_task_create_failed)
+        self._create_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _remember_encoded_image(self) -> None:
+        worker = self._create_worker
+        self._create_worker = None
+        if worker is not None and worker.image_uri is not None:
+            self._encoded_cache = (*self._pending_image_key, worker.image_uri)
+        self._close_idle_clients()
+
+    def _on_task_create_failed(self, message: str) -> None:
+        self._remember_encoded_image()
+        self._generate_button.setEnabled(True)
+        self._status_label.setText(message)
+
+    def _on_task_created(self, task_id: str) -> None:
+        self._remember_encoded_image()
+        self._generate_button.setEnabled(True)
+        options = self._pending_options
         self._current_task_id = task_id
         self._current_created_at = datetime.utcnow().isoformat()
         self._last_options = options
+        self._last_progress = None
+        self._last_status = ""
+        self._last_persisted_progress = -1.0
+        self._last_persist_ts = 0.0
 
         record = TaskHistoryRecord(
             task_id=task_id,
@@ -253,18 +412,23 @@ class GeneratorView(QWidget):
             options=options,
             local_glb_path=None,
         )
+        # Close any batch left by a previous task so the insert commits on its
+        # own; status and progress writes are then batched until this task ends.
+        self._end_storage_batch()
         self._storage.upsert(record)
+        self._storage.begin()
+        self._storage_batch_open = True
 
         self._progress_bar.setValue(0)
         self._status_label.setText("Task submitted. Awaiting progress...")
         self._open_viewer_button.setEnabled(False)
 
         self._task_runner = TaskRunner(self._client, task_id)
-        self._task_runner.progressChanged.connect(self._progress_bar.setValue)
-        self._task_runner.progressChanged.connect(self._handle_progress_update)
-        self._task_runner.statusChanged.connect(self._handle_status_update)
+        self._task_runner.changed.connect(self._on_task_changed)
         self._task_runner.taskCompleted.connect(self._handle_task_complete)
         self._task_runner.taskFailed.connect(self._handle_task_failed)
+        self._task_runner.monitoringEnded.connect(partial(self._on_monitoring_ended, task_id))
+        self._active_runners[task_id] = self._task_runner
         self._task_runner.start()
 
     def _collect_options(self) -> Dict[str, object]:
@@ -290,37 +454,26 @@ class GeneratorView(QWidget):
             return custom.text().strip() or None
         return value or None
 
-    def _handle_status_update(self, status: str) -> None:
-        self._status_label.setText(f"Status: {status}")
+    def _on_task_changed(self, status: str, progress: int) -> None:
+        status_changed = status != self._last_status
+        if status_changed:
+            self._last_status = status
+            self._status_label.setText(f"Status: {status}")
+        if progress >= 0:
+            self._last_progress = float(progress)
+            self._progress_bar.setValue(progress)
         if not self._current_task_id:
             return
-        record = TaskHistoryRecord(
-            task_id=self._current_task_id,
-            created_at=self._current_created_at or datetime.utcnow().isoformat(),
-            status=status,
-            progress=self._last_progress,
-            thumbnail_url=None,
-            model_urls={},
-            options=self._last_options,
-            local_glb_path=None,
-        )
-        self._storage.upsert(record)
-
-    def _handle_progress_update(self, progress: int) -> None:
-        self._last_progress = float(progress)
-        if not self._current_task_id:
+        progress_value = self._last_progress if self._last_progress is not None else -1.0
+        now = time.monotonic()
+        if not status_changed and (
+            abs(progress_value - self._last_persisted_progress) < 1
+            and now - self._last_persist_ts < 0.5
+        ):
             return
-        record = TaskHistoryRecord(
-            task_id=self._current_task_id,
-            created_at=self._current_created_at or datetime.utcnow().isoformat(),
-            status="IN_PROGRESS",
-            progress=self._last_progress,
-            thumbnail_url=None,
-            model_urls={},
-            options=self._last_options,
-            local_glb_path=None,
-        )
-        self._storage.upsert(record)
+        self._last_persisted_progress = progress_value
+        self._last_persist_ts = now
+        self._storage.update_progress(self._current_task_id, self._last_progress, status)
 
     def _handle_task_complete(self, payload: Dict[str, object]) -> None:
         model_urls = payload.get("model_urls") or {}
@@ -337,12 +490,27 @@ class GeneratorView(QWidget):
             local_glb_path=self._last_download.as_posix() if self._last_download else None,
         )
         self._storage.upsert(record)
+        self._end_storage_batch()
         self._status_label.setText("Task complete. Downloading model...")
         self._download_glb(model_urls)
 
     def _handle_task_failed(self, message: str) -> None:
+        self._end_storage_batch()
         self._status_label.setText(f"Task failed: {message}")
 
+    def _on_monitoring_ended(self, task_id: str) -> None:
+        # A runner can stop without a terminal signal; never leave its batch open.
+        # An older runner ending late must not commit the current task's batch.
+        if task_id == self._current_task_id:
+            self._end_storage_batch()
+        self._active_runners.pop(task_id, None)
+        self._close_idle_clients()
+
+    def _end_storage_batch(self) -> None:
+        if self._storage_batch_open:
+            self._storage_batch_open = False
+            self._storage.commit()
+
     def _download_glb(self, model_urls: Dict[str, object]) -> None:
         url = None
         if isinstance(model_urls, dict):
@@ -350,16 +518,51 @@ class GeneratorView(QWidget):
         if not url or not self._client:
             self._status_label.setText("Task finished but no model URL was returned.")
             return
+        if self._download_worker is not None:
+            # Both downloads target the same file; start this one when the first ends.
+            self._queued_model_urls = model_urls
+            return
         download_dir = Path(
             QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
         ) / "downloads"
         download_dir.mkdir(parents=True, exist_ok=True)
         destination = download_dir / "meshy_model.glb"
-        try:
-            self._last_download = self._client.download_file(str(url), destination)
-        except MeshyApiError as exc:
-            self._status_label.setText(str(exc))
-            return
+        self._download_model_urls = model_urls
+        self._progress_bar.setValue(0)
+        worker = DownloadWorker(self._client, str(url), destination)
+        worker.progress.connect(self._on_download_progress)
+        worker.completed.connect(self._on_download_done)
+        worker.failed.connect(self._on_download_failed)
+        worker.finished.connect(self._on_download_finished)
+        self._download_worker = worker
+        worker.start()
+
+    def _on_download_finished(self) -> None:
+        worker = self._download_worker
+        self._download_worker = None
+        if worker is not None:
+            worker.deleteLater()
+        self._close_idle_clients()
+        queued, self._queued_model_urls = self._queued_model_urls, None
+        if queued is not None:
+            self._download_glb(queued)
+
+    def _on_download_progress(self, received: int, total: int) -> None:
+        if total > 0:
+            self._progress_bar.setRange(0, 100)
+            self._progress_bar.setValue(min(100, received * 100 // total))
+        else:
+            self._progress_bar.setRange(0, 0)
+
+    def _on_download_failed(self, message: str) -> None:
+        self._progress_bar.setRange(0, 100)
+        self._status_label.setText(message)
+
+    def _on_download_done(self, path: Path) -> None:
+        self._progress_bar.setRange(0, 100)
+        self._progress_bar.setValue(100)
+        self._last_download = path
+        model_urls = self._download_model_urls
         if self._current_task_id:
             record = TaskHistoryRecord(
                 task_id=self._current_task_id,
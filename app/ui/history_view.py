@@ -2,27 +2,129 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import re
 import time
-from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Dict, Optional, Tuple
 
-from PySide6.QtCore import Qt, QStandardPaths, QUrl, Signal
-from PySide6.QtGui import QPixmap
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from PySide6.QtCore import (
+    QObject,
+    QPoint,
+    QRect,
+    QRunnable,
+    QSize,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import QColor, QImage, QPixmap, QPixmapCache
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest
 from PySide6.QtWidgets import (
-    QHBoxLayout,
     QLabel,
     QListWidget,
     QListWidgetItem,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 
-from app.core.meshy_client import MeshyApiError, MeshyClient
+from app.core.meshy_client import MeshyClient
 from app.core.storage import TaskHistoryRecord, TaskStorage
+from app.core.task_runner import AsyncCall
+
+PIXMAP_CACHE_LIMIT_KB = 50 * 1024
+# Rows above and below the viewport whose thumbnails are fetched ahead of scrolling.
+THUMBNAIL_PREFETCH_ROWS = 2
+HISTORY_PAGE_SIZE = 50
+THUMBNAIL_SIZE = 64
+ROW_MARGIN = 6
+
+# Item data roles beyond the stored record in Qt.UserRole.
+PENDING_URL_ROLE = Qt.UserRole + 1
+PLACEHOLDER_ROLE = Qt.UserRole + 2
+
+# The value must be all digits up to the next parameter, fragment or end, as
+# parse_qs + int() required; "Expires=123abc" means no usable expiry.
+EXPIRES_RE = re.compile(r"[?&][Ee]xpires=(\d+)(?:&|#|$)")
+
+
+@lru_cache(maxsize=512)
+def _expires_timestamp(url: str) -> Optional[int]:
+    match = EXPIRES_RE.search(url)
+    return int(match.group(1)) if match else None
+
+
+class _ThumbnailSignals(QObject):
+    decoded = Signal(object, QImage)
+
+
+class ThumbnailDecodeRunnable(QRunnable):
+    """Decodes and scales thumbnail bytes into a QImage on a pool thread."""
+
+    def __init__(self, data: bytes, token: int, size: QSize, signals: _ThumbnailSignals) -> None:
+        super().__init__()
+        self.data = data
+        self.token = token
+        self.size = size
+        self.signals = signals
+
+    def run(self) -> None:
+        # QImage is safe to use off the GUI thread; QPixmap is not.
+        image = QImage.fromData(self.data)
+        if not image.isNull():
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.decoded.emit(self.token, image)
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Paints history rows directly instead of composing a widget tree per row."""
+
+    def paint(self, painter, option, index) -> None:
+        painter.save()
+        selected = bool(option.state & QStyle.State_Selected)
+        if selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        text_color = (
+            option.palette.highlightedText().color() if selected else option.palette.text().color()
+        )
+        painter.setFont(option.font)
+
+        rect = option.rect.adjusted(ROW_MARGIN, ROW_MARGIN, -ROW_MARGIN, -ROW_MARGIN)
+        thumb_rect = QRect(
+            rect.left(),
+            rect.top() + (rect.height() - THUMBNAIL_SIZE) // 2,
+            THUMBNAIL_SIZE,
+            THUMBNAIL_SIZE,
+        )
+        painter.setPen(QColor("#ccc"))
+        painter.drawRect(thumb_rect.adjusted(0, 0, -1, -1))
+        pixmap = index.data(Qt.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            painter.drawPixmap(
+                thumb_rect.left() + (THUMBNAIL_SIZE - pixmap.width()) // 2,
+                thumb_rect.top() + (THUMBNAIL_SIZE - pixmap.height()) // 2,
+                pixmap,
+            )
+        else:
+            painter.setPen(text_color)
+            placeholder = index.data(PLACEHOLDER_ROLE) or "No thumbnail"
+            painter.drawText(thumb_rect, Qt.AlignCenter | Qt.TextWordWrap, placeholder)
+
+        text_rect = rect.adjusted(THUMBNAIL_SIZE + ROW_MARGIN, 0, 0, 0)
+        painter.setPen(text_color)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), THUMBNAIL_SIZE + 2 * ROW_MARGIN)
 
 
 class HistoryView(QWidget):
@@ -35,13 +137,35 @@ class HistoryView(QWidget):
         self.setObjectName("history_view")
         self._api_key: Optional[str] = None
         self._client: Optional[MeshyClient] = None
+        # In-flight status refreshes keyed by task id, held so they are not collected.
+        self._status_calls: Dict[str, AsyncCall] = {}
 
-        self._storage = TaskStorage(self._db_path())
+        self._storage = TaskStorage.shared(self._db_path())
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
         self._network = QNetworkAccessManager(self)
-        self._thumbnail_replies: Dict[int, QLabel] = {}
+        disk_cache = QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(self._thumbnail_cache_dir())
+        self._network.setCache(disk_cache)
+        # Keyed by reply token; values are (task_id, pixmap cache key). Tokens come
+        # from a counter because id() of a deleted reply can be reused.
+        self._reply_tokens = itertools.count(1)
+        self._thumbnail_replies: Dict[int, Tuple[str, str]] = {}
+        self._pending_decodes: Dict[int, Tuple[str, str]] = {}
+        self._items: Dict[str, QListWidgetItem] = {}
+        self._thumbnail_signals = _ThumbnailSignals(self)
+        self._thumbnail_signals.decoded.connect(self._handle_thumbnail_decoded)
 
         self._list = QListWidget()
+        self._list.setItemDelegate(HistoryItemDelegate(self._list))
+        self._list.setUniformItemSizes(True)
         self._list.itemSelectionChanged.connect(self._handle_selection)
+        self._list.verticalScrollBar().valueChanged.connect(self._request_visible_thumbnails)
+        self._list.verticalScrollBar().valueChanged.connect(self._maybe_load_more)
+        # (created_at, task_id) of the oldest loaded row; the next page starts after it.
+        self._page_key: Optional[Tuple[str, str]] = None
+        # Key of the newest loaded row; tasks stored after it are added on show.
+        self._head_key: Optional[Tuple[str, str]] = None
+        self._has_more = False
 
         self._status_label = QLabel("Select a task to see details.")
         self._open_button = QPushButton("Open in Viewer")
@@ -54,18 +178,70 @@ class HistoryView(QWidget):
     def set_api_key(self, api_key: str) -> None:
         """Set the API key for refreshing task status from Meshy."""
         self._api_key = api_key
+        # In-flight refreshes use the old client; stop them before closing it.
+        for call in self._status_calls.values():
+            call.cancel()
+            call.deleteLater()
+        self._status_calls.clear()
+        if self._client:
+            self._client.close()
         self._client = MeshyClient(api_key)
 
     def refresh(self) -> None:
         """Reload the task list from storage."""
         self._list.clear()
-        for record in self._storage.list_all():
-            self._add_task_item(record)
+        # Drop references to rows that no longer exist.
+        self._items.clear()
+        self._thumbnail_replies.clear()
+        self._pending_decodes.clear()
+        self._page_key = None
+        self._head_key = None
+        self._load_next_page()
+
+    def _load_next_page(self) -> None:
+        records = self._storage.list_range(HISTORY_PAGE_SIZE, self._page_key)
+        self._has_more = len(records) == HISTORY_PAGE_SIZE
+        if records:
+            self._page_key = (records[-1].created_at, records[-1].task_id)
+            if self._head_key is None:
+                self._head_key = (records[0].created_at, records[0].task_id)
+        for record in records:
+            if record.task_id not in self._items:
+                self._add_task_item(record)
+        # Wait for the list to lay out its rows before deciding what is visible.
+        QTimer.singleShot(0, self._request_visible_thumbnails)
+
+    def _maybe_load_more(self, value: int) -> None:
+        if self._has_more and value >= 0.9 * self._list.verticalScrollBar().maximum():
+            self._load_next_page()
+
+    def _load_new_records(self) -> None:
+        if self._head_key is None:
+            self.refresh()
+            return
+        records = self._storage.list_newer(self._head_key)
+        if not records:
+            return
+        self._head_key = (records[0].created_at, records[0].task_id)
+        # Oldest first, each inserted at the top, so the newest ends up first.
+        for record in reversed(records):
+            if record.task_id not in self._items:
+                self._add_task_item(record, row=0)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # Pick up tasks GeneratorView stored since the list was last shown.
+        self._load_new_records()
+        self._request_visible_thumbnails()
 
     def _db_path(self) -> str:
         base = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
         return str(base / "task_history.sqlite3")
 
+    def _thumbnail_cache_dir(self) -> str:
+        base = Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation))
+        return str(base / "thumbnails")
+
     def _build_layout(self) -> None:
         layout = QVBoxLayout()
         layout.addWidget(self._list)
@@ -73,59 +249,97 @@ class HistoryView(QWidget):
         layout.addWidget(self._open_button)
         self.setLayout(layout)
 
-    def _add_task_item(self, record: TaskHistoryRecord) -> None:
-        item = QListWidgetItem()
+    def _add_task_item(self, record: TaskHistoryRecord, row: Optional[int] = None) -> None:
+        item = QListWidgetItem(self._format_row_text(record))
         item.setData(Qt.UserRole, record)
+        if row is None:
+            self._list.addItem(item)
+        else:
+            self._list.insertItem(row, item)
+        self._items[record.task_id] = item
+        if record.thumbnail_url:
+            self._load_thumbnail(item, record.thumbnail_url)
 
-        widget = QWidget()
-        row_layout = QHBoxLayout()
-        row_layout.setContentsMargins(6, 6, 6, 6)
-
-        thumbnail = QLabel("No thumbnail")
-        thumbnail.setFixedSize(64, 64)
-        thumbnail.setAlignment(Qt.AlignCenter)
-        thumbnail.setStyleSheet("border: 1px solid #ccc;")
-
-        text = QLabel(self._format_row_text(record))
-        text.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+    def _load_thumbnail(self, item: QListWidgetItem, url: str) -> None:
+        cache_key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            item.setData(Qt.DecorationRole, cached)
+            item.setData(PENDING_URL_ROLE, None)
+            return
+        # Fetched once the row scrolls into view; see _request_visible_thumbnails.
+        item.setData(PENDING_URL_ROLE, url)
 
-        row_layout.addWidget(thumbnail)
-        row_layout.addWidget(text, 1)
-        widget.setLayout(row_layout)
+    def _request_visible_thumbnails(self, *_args: object) -> None:
+        count = self._list.count()
+        if not count or not self.isVisible():
+            return
+        viewport = self._list.viewport()
+        first = self._list.indexAt(QPoint(0, 0)).row()
+        last = self._list.indexAt(QPoint(0, viewport.height() - 1)).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = count - 1
+        start = max(0, first - THUMBNAIL_PREFETCH_ROWS)
+        stop = min(count, last + THUMBNAIL_PREFETCH_ROWS + 1)
+        for row in range(start, stop):
+            item = self._list.item(row)
+            url = item.data(PENDING_URL_ROLE)
+            if url:
+                item.setData(PENDING_URL_ROLE, None)
+                self._fetch_thumbnail(item.data(Qt.UserRole).task_id, url)
 
-        item.setSizeHint(widget.sizeHint())
-        self._list.addItem(item)
-        self._list.setItemWidget(item, widget)
+    def _fetch_thumbnail(self, task_id: str, url: str) -> None:
+        cache_key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        reply = self._network.get(self._make_request(url))
+        reply_id = next(self._reply_tokens)
+        self._thumbnail_replies[reply_id] = (task_id, cache_key)
+        reply.finished.connect(lambda r=reply, rid=reply_id: self._handle_thumbnail(r, rid))
 
-        if record.thumbnail_url:
-            reply = self._network.get(QNetworkRequest(QUrl(record.thumbnail_url)))
-            reply_id = id(reply)
-            self._thumbnail_replies[reply_id] = thumbnail
-            reply.finished.connect(lambda r=reply, rid=reply_id: self._handle_thumbnail(r, rid))
+    def _make_request(self, url: str) -> QNetworkRequest:
+        # Qt 6 already allows HTTP/2 by default; set explicitly since thumbnails from
+        # one CDN host rely on sharing a multiplexed connection.
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        request.setAttribute(QNetworkRequest.Http2CleartextAllowedAttribute, False)
+        request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
+        return request
 
     def _format_row_text(self, record: TaskHistoryRecord) -> str:
-        created_at = record.created_at
-        try:
-            created_at = datetime.fromisoformat(record.created_at).strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            pass
-        return f"{record.status} • {created_at}"
+        return f"{record.status} • {record.created_at_display}"
 
     def _handle_thumbnail(self, reply, reply_id: int) -> None:
-        label = self._thumbnail_replies.pop(reply_id, None)
-        if not label:
+        entry = self._thumbnail_replies.pop(reply_id, None)
+        if not entry:
             reply.deleteLater()
             return
+        task_id, cache_key = entry
         if reply.error():
-            label.setText("No preview")
+            item = self._items.get(task_id)
+            if item:
+                item.setData(PLACEHOLDER_ROLE, "No preview")
         else:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(bytes(data))
-            if not pixmap.isNull():
-                label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            data = bytes(reply.readAll())
+            self._pending_decodes[reply_id] = entry
+            size = QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+            QThreadPool.globalInstance().start(
+                ThumbnailDecodeRunnable(data, reply_id, size, self._thumbnail_signals)
+            )
         reply.deleteLater()
 
+    def _handle_thumbnail_decoded(self, token: int, image: QImage) -> None:
+        entry = self._pending_decodes.pop(token, None)
+        if not entry or image.isNull():
+            return
+        task_id, cache_key = entry
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        item = self._items.get(task_id)
+        if item:
+            # Setting item data repaints just this row through the delegate.
+            item.setData(Qt.DecorationRole, pixmap)
+
     def _handle_selection(self) -> None:
         items = self._list.selectedItems()
         if not items:
@@ -134,18 +348,27 @@ class HistoryView(QWidget):
         record = items[0].data(Qt.UserRole)
         if not record:
             return
-        self._refresh_task_status(record)
+        self._refresh_task_status(items[0], record)
 
-    def _refresh_task_status(self, record: TaskHistoryRecord) -> None:
+    def _refresh_task_status(self, item: QListWidgetItem, record: TaskHistoryRecord) -> None:
+        self._update_open_state(record)
         if not self._client:
             self._status_label.setText("Log in to refresh task status.")
-            self._update_open_state(record)
             return
-        try:
-            payload = self._client.get_image_to_3d_task(record.task_id)
-        except MeshyApiError as exc:
-            self._status_label.setText(str(exc))
-            self._update_open_state(record)
+        if record.task_id in self._status_calls:
+            return
+        self._status_label.setText("Refreshing task status...")
+        call = AsyncCall(self._client.get_image_to_3d_task_async(record.task_id), self)
+        call.succeeded.connect(partial(self._on_task_status, record.task_id))
+        call.failed.connect(partial(self._on_task_status_failed, record.task_id))
+        self._status_calls[record.task_id] = call
+        call.start()
+
+    def _on_task_status(self, task_id: str, payload: dict) -> None:
+        self._finish_status_call(task_id)
+        item = self._items.get(task_id)
+        record = item.data(Qt.UserRole) if item else None
+        if not record:
             return
         updated = TaskHistoryRecord(
             task_id=record.task_id,
@@ -158,9 +381,36 @@ class HistoryView(QWidget):
             local_glb_path=record.local_glb_path,
         )
         self._storage.upsert(updated)
-        self._status_label.setText(f"Status: {updated.status}")
-        self.refresh()
-        self._update_open_state(updated)
+        self._update_row(item, record, updated)
+        if self._is_selected(task_id):
+            self._status_label.setText(f"Status: {updated.status}")
+            self._update_open_state(updated)
+
+    def _on_task_status_failed(self, task_id: str, message: str) -> None:
+        self._finish_status_call(task_id)
+        if self._is_selected(task_id):
+            self._status_label.setText(message)
+
+    def _finish_status_call(self, task_id: str) -> None:
+        call = self._status_calls.pop(task_id, None)
+        if call is not None:
+            call.deleteLater()
+
+    def _is_selected(self, task_id: str) -> bool:
+        items = self._list.selectedItems()
+        if not items:
+            return False
+        record = items[0].data(Qt.UserRole)
+        return bool(record) and record.task_id == task_id
+
+    def _update_row(
+        self, item: QListWidgetItem, previous: TaskHistoryRecord, updated: TaskHistoryRecord
+    ) -> None:
+        item.setData(Qt.UserRole, updated)
+        item.setText(self._format_row_text(updated))
+        if updated.thumbnail_url and updated.thumbnail_url != previous.thumbnail_url:
+            self._load_thumbnail(item, updated.thumbnail_url)
+            self._request_visible_thumbnails()
 
     def _update_open_state(self, record: TaskHistoryRecord) -> None:
         url = self._resolve_model_url(record)
@@ -182,16 +432,8 @@ class HistoryView(QWidget):
         return str(url)
 
     def _is_url_expired(self, url: str) -> bool:
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        expires = params.get("Expires") or params.get("expires")
-        if not expires:
-            return False
-        try:
-            expiry = int(expires[0])
-        except (TypeError, ValueError):
-            return False
-        return time.time() > expiry
+        expiry = _expires_timestamp(url)
+        return expiry is not None and time.time() > expiry
 
     def _handle_open(self) -> None:
         items = self._list.selectedItems()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -15,6 +17,15 @@ from PySide6.QtWidgets import (
 
 from app.core.meshy_client import MeshyClient
 from app.core.secrets import delete_key, load_key, save_key
+from app.core.task_runner import AsyncCall
+
+
+async def _validate_key(api_key: str) -> bool:
+    client = MeshyClient(api_key)
+    try:
+        return await client.validate_key_async()
+    finally:
+        await client.aclose()
 
 
 class LoginView(QWidget):
@@ -45,6 +56,9 @@ class LoginView(QWidget):
         self._status_label.setWordWrap(True)
         self._status_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
+        self._validate_call: Optional[AsyncCall] = None
+        self._pending_key = ""
+
         self._build_layout()
         self._load_saved_key()
 
@@ -83,15 +97,37 @@ class LoginView(QWidget):
         if not api_key:
             self._status_label.setText("Please enter an API key.")
             return
+        if self._validate_call is not None:
+            return
         self._status_label.setText("Validating API key...")
-        client = MeshyClient(api_key)
-        if client.validate_key():
+        self._continue_button.setEnabled(False)
+        self._pending_key = api_key
+        self._validate_call = AsyncCall(_validate_key(api_key), self)
+        self._validate_call.succeeded.connect(self._on_key_validated)
+        self._validate_call.failed.connect(self._on_key_validation_failed)
+        self._validate_call.start()
+
+    def _on_key_validated(self, valid: bool) -> None:
+        api_key = self._pending_key
+        self._finish_validation()
+        if valid:
             save_key(api_key)
             self._status_label.setText("API key saved.")
             self.loginSuccess.emit(api_key)
         else:
             self._status_label.setText("Invalid API key. Please try again.")
 
+    def _on_key_validation_failed(self, message: str) -> None:
+        self._finish_validation()
+        self._status_label.setText(f"Could not validate API key: {message}")
+
+    def _finish_validation(self) -> None:
+        if self._validate_call is not None:
+            self._validate_call.deleteLater()
+            self._validate_call = None
+        self._pending_key = ""
+        self._continue_button.setEnabled(True)
+
     def _handle_forget(self) -> None:
         delete_key()
         self._api_input.clear()
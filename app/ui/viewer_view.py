@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import QUrl, Signal
+from PySide6.QtCore import QObject, QUrl, Signal, Slot
+from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
 
+class ViewerBridge(QObject):
+    """Object shared with the viewer page over QWebChannel."""
+
+    loadModelRequested = Signal(str)
+    ready = Signal()
+
+    @Slot()
+    def viewerReady(self) -> None:
+        """Called by the page once it has connected to the bridge."""
+        self.ready.emit()
+
+
 class ViewerView(QWidget):
     """Widget responsible for displaying Meshy-generated 3D assets."""
 
@@ -20,6 +33,15 @@ class ViewerView(QWidget):
         self.setObjectName("viewer_view")
 
         self._web_view = QWebEngineView(self)
+        self._viewer_ready = False
+        self._pending_url: Optional[str] = None
+
+        self._bridge = ViewerBridge(self)
+        self._bridge.ready.connect(self._handle_viewer_ready)
+        self._channel = QWebChannel(self)
+        self._channel.registerObject("bridge", self._bridge)
+        self._web_view.page().setWebChannel(self._channel)
+        self._web_view.loadStarted.connect(self._handle_load_started)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -38,6 +60,18 @@ class ViewerView(QWidget):
         file_url = path
         if not path.startswith("file://"):
             file_url = QUrl.fromLocalFile(path).toString()
-        payload = json.dumps(file_url)
-        self._web_view.page().runJavaScript(f"window.loadModel({payload})")
+        if self._viewer_ready:
+            self._bridge.loadModelRequested.emit(file_url)
+        else:
+            # Only the most recent request matters once the page is ready.
+            self._pending_url = file_url
         self.load_requested.emit(file_url)
+
+    def _handle_load_started(self) -> None:
+        self._viewer_ready = False
+
+    def _handle_viewer_ready(self) -> None:
+        self._viewer_ready = True
+        if self._pending_url:
+            url, self._pending_url = self._pending_url, None
+            self._bridge.loadModelRequested.emit(url)